@@ -0,0 +1,22 @@
+"""
+Optional Cython build for the brute_force_lp_friendly inner loop.
+
+All metadata lives in pyproject.toml.  If Cython or a C compiler is missing
+the extension is skipped and brute_force_lp.friendly runs in pure Python.
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        "src/brute_force_lp/_friendly.pyx",
+        compiler_directives={"language_level": 3},
+    )
+    for ext in ext_modules:
+        ext.optional = True
+
+setup(ext_modules=ext_modules)
@@ -1 +1 @@
-from .core import brute_force_lp, sample_lp
\ No newline at end of file
+from .core import Report, brute_force_lp, sample_lp
\ No newline at end of file
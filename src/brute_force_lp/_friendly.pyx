@@ -0,0 +1,101 @@
+# cython: language_level=3
+"""
+Compiled inner loop for brute_force_lp_friendly (silent mode only).
+
+The LP arrives pre-flattened by the Python wrapper in friendly.py:
+  A      – (C, V) constraint coefficients, every row read as A x <= rhs
+  rhs    – (C,)   right-hand sides
+  cobj   – (V,)   objective coefficients
+  ubs    – (V,)   upper bound of each variable
+"""
+
+cimport cython
+from libc.stdlib cimport malloc, free
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cpdef tuple brute_force_c(
+    double[:, :] A,
+    double[:] rhs,
+    double[:] cobj,
+    long long[:] ubs,
+    long long step,
+    bint maximize,
+):
+    """
+    Walk the integer grid in lexicographic (column) order and return
+    (best_combo, counter); best_combo is None when nothing is feasible.
+    """
+    cdef Py_ssize_t C = A.shape[0], V = A.shape[1], c, i, j
+    cdef long long counter = 0
+    cdef bint found = False, ok
+    cdef double obj, best_obj = 0.0
+    cdef long long *combo
+    cdef long long *best
+    cdef double *lhs
+    cdef double *part
+
+    for i in range(V):
+        if ubs[i] < 0:
+            return None, 0
+
+    combo = <long long *> malloc((V + 1) * sizeof(long long))
+    best  = <long long *> malloc((V + 1) * sizeof(long long))
+    # part[i] holds the running (lhs..., objective) after the first i vars,
+    # summed left to right exactly like the Python generator expressions
+    part  = <double *> malloc((V + 1) * (C + 1) * sizeof(double))
+    if combo == NULL or best == NULL or part == NULL:
+        free(combo); free(best); free(part)
+        raise MemoryError()
+
+    try:
+        for i in range(V):
+            combo[i] = 0
+        for j in range((V + 1) * (C + 1)):
+            part[j] = 0.0
+        lhs = part + V * (C + 1)
+
+        while True:
+            # ---- leaf: feasibility + objective ---------------------------
+            ok = True
+            for c in range(C):
+                if lhs[c] > rhs[c]:
+                    ok = False
+                    break
+            if ok:
+                counter += 1
+                obj = lhs[C]
+                if not found or (obj > best_obj if maximize
+                                 else obj < best_obj):
+                    found, best_obj = True, obj
+                    for i in range(V):
+                        best[i] = combo[i]
+
+            # ---- advance the odometer ------------------------------------
+            i = V - 1
+            while i >= 0 and combo[i] + step > ubs[i]:
+                combo[i] = 0
+                i -= 1
+            if i < 0:
+                break
+            combo[i] += step
+
+            # ---- refresh partial sums from level i downward --------------
+            for j in range(i, V):
+                for c in range(C):
+                    part[(j + 1) * (C + 1) + c] = (
+                        part[j * (C + 1) + c] + A[c, j] * combo[j]
+                    )
+                part[(j + 1) * (C + 1) + C] = (
+                    part[j * (C + 1) + C] + cobj[j] * combo[j]
+                )
+
+        if not found:
+            return None, counter
+        return tuple([best[i] for i in range(V)]), counter
+    finally:
+        free(combo)
+        free(best)
+        free(part)
@@ -0,0 +1,56 @@
+"""
+Parallel Numba scan of the brute_force_lp grid.
+
+Imported lazily by brute_force_lp.core._search_numba, so numba is only
+loaded (and the kernel only compiled / read from its cache) for grids big
+enough to pay for it.
+"""
+
+import numpy as np
+from numba import get_num_threads, njit, prange
+
+__all__ = ["bf_numba", "get_num_threads"]
+
+
+@njit(parallel=True, cache=True)
+def bf_numba(A, rhs, cobj, sizes, step, nchunks):
+    """Multithreaded scan: each chunk of flat indices keeps its own best,
+    then chunks are merged in order so ties keep the lowest index."""
+    C, V  = A.shape
+    total = 1
+    for v in range(V):
+        total *= sizes[v]
+    chunk    = (total + nchunks - 1) // nchunks
+    best_obj = np.full(nchunks, -np.inf)
+    best_idx = np.full(nchunks, -1, dtype=np.int64)
+
+    for t in prange(nchunks):
+        combo = np.empty(V, dtype=np.int64)
+        for idx in range(t * chunk, min(total, (t + 1) * chunk)):
+            rem = idx
+            for v in range(V - 1, -1, -1):
+                combo[v] = (rem % sizes[v]) * step
+                rem //= sizes[v]
+
+            feasible = True
+            for c in range(C):
+                lhs = 0.0
+                for v in range(V):
+                    lhs += A[c, v] * combo[v]
+                if lhs > rhs[c]:
+                    feasible = False
+                    break
+            if not feasible:
+                continue
+
+            obj = 0.0
+            for v in range(V):
+                obj += cobj[v] * combo[v]
+            if best_idx[t] < 0 or obj > best_obj[t]:
+                best_obj[t], best_idx[t] = obj, idx
+
+    result = -1
+    for t in range(nchunks):
+        if best_idx[t] >= 0 and (result < 0 or best_obj[t] > best_obj[result]):
+            result = t
+    return -1 if result < 0 else best_idx[result]
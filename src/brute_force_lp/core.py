@@ -5,76 +5,262 @@ Input = JSON dict that matches the schema produced by lp_parser.parse_word_probl
 """
 
 from __future__ import annotations
-import itertools, numpy as np, pandas as pd
+import importlib.util, math, numpy as np
+from collections import namedtuple
+
+_BLOCK = 1 << 20  # grid points evaluated per chunk in brute_force_lp
+# numba is optional.  Even from a warm on-disk cache, loading it plus the
+# kernel costs ~0.4 s, so chunked NumPy stays faster below roughly 10M
+# points; only grids past _NUMBA_MIN go to the JIT kernel.
+_HAS_NUMBA = importlib.util.find_spec("numba") is not None
+_NUMBA_MIN = 1 << 24
 
 # ---------------------------------------------------------------------
-def brute_force_lp(lp: dict, step: int = 1):
+class Report(namedtuple("Report", "rows")):
     """
-    Exhaustively enumerate every integer combination up to each var's 'ub',
-    stepping by `step` (default 1).  Returns:
-      best_dict  – dict of variable values + 'objective'
-      report_df  – dataframe: constraint | lhs | rhs
+    Per-constraint report returned by the brute-force solvers.
+    `rows` is a list of dicts (one per constraint); pandas is only imported
+    if you ask for a DataFrame via `to_dataframe()`.
     """
-    vars_   = list(lp["vars"].keys())
-    bounds  = [lp["vars"][v]["ub"] for v in vars_]
-    best    = {"objective": -float("inf")}
+    __slots__ = ()
+
+    def to_dataframe(self):
+        import pandas as pd
+        return pd.DataFrame(self.rows)
+
+
+# ---------------------------------------------------------------------
+def _compile_lp(lp: dict):
+    """
+    Walk the LP dict once and return flat arrays for the hot loops:
+      A (R, V), rhs (R,), cobj (V,), bounds (V,),
+      vars_ – column order of A / cobj / bounds.
+    Every constraint is rewritten as `A x <= rhs`: the first C rows are the
+    constraints in dict order ('>=' rows negated), followed by one negated
+    copy of each '=' row.  Missing coefficients count as 0.
+    """
+    vars_  = list(lp["vars"].keys())
+    cons   = lp["constraints"]
+    A      = np.array(
+        [[con["coeff"].get(v, 0) for v in vars_] for con in cons]
+    ).reshape(len(cons), len(vars_))
+    rhs    = np.array([con["rhs"] for con in cons])
+    cobj   = np.array([lp["objective"]["coeff"].get(v, 0) for v in vars_])
+    bounds = np.array([lp["vars"][v]["ub"] for v in vars_], dtype=np.int64)
+    # empty lists come out float64; keep a size-0 A / cobj integral so an
+    # LP with no variables still reports int 0s
+    A, cobj = (x.astype(np.int64) if x.size == 0 else x for x in (A, cobj))
+
+    senses = [con.get("sense", "<=") for con in cons]
+    for sense in set(senses) - {"<=", ">=", "="}:
+        raise ValueError(f"Unknown constraint sense {sense!r}.")
+    flip = np.array([s == ">=" for s in senses], dtype=bool)
+    eq   = np.array([s == "=" for s in senses], dtype=bool)
+    A    = np.where(flip[:, None], -A, A)
+    rhs  = np.where(flip, -rhs, rhs)
+    A, rhs = np.vstack([A, -A[eq]]), np.concatenate([rhs, -rhs[eq]])
+    return A, rhs, cobj, bounds, vars_
+
 
-    # Cartesian product of all integer counts
-    for combo in itertools.product(*(range(0, ub + 1, step) for ub in bounds)):
-        trial = dict(zip(vars_, combo))
+def _con_lhs(lp: dict, A: np.ndarray, x: np.ndarray) -> list:
+    """LHS of each original constraint at `x`, undoing the '>=' flip.
+    Summed as Python numbers, so huge integer rows cannot wrap."""
+    lhs = A[: len(lp["constraints"])].astype(object) @ x.astype(object)
+    return [-v if con.get("sense", "<=") == ">=" else v
+            for con, v in zip(lp["constraints"], lhs.tolist())]
+
+
+def _is_int(x: np.ndarray) -> bool:
+    return x.dtype.kind in "iub" or x.size == 0
+
+
+def _grid_dtype(A, c_vec, sizes, step):
+    """Narrowest integer dtype that holds every grid value, row sum and
+    objective exactly (a 2**20-point int16 scan in _search_numpy runs ~15%
+    faster than int64), or object past the int64 range; float
+    coefficients keep their float dtype."""
+    if not (_is_int(A) and _is_int(c_vec)):
+        return np.result_type(A, c_vec, np.float64)
+    # Python ints, so the guard itself cannot wrap.  step is counted on its
+    # own: grid indices are scaled by it in place in this dtype, even when
+    # every range is a single point (top == 0).
+    top  = [(n - 1) * step for n in sizes]
+    rows = np.vstack([A, c_vec]).tolist()
+    peak = max([step, *top]
+               + [sum(abs(a) * t for a, t in zip(row, top)) for row in rows])
+    for dt in (np.int16, np.int32, np.int64):
+        if peak <= np.iinfo(dt).max:
+            return np.dtype(dt)
+    return np.dtype(object)  # past int64: exact Python ints, never wraps
+
+
+# ---------------------------------------------------------------------
+def _search_numpy(A, rhs, c_vec, sizes, step):
+    """Chunked NumPy scan of the grid; returns the flat C-order index of the
+    best feasible combo, or None."""
+    total = math.prod(sizes)
+    block = max(1, min(_BLOCK, total))
+    dtype = _grid_dtype(A, c_vec, sizes, step)
+    A, c_vec = A.astype(dtype), c_vec.astype(dtype)
+    lhs_buf  = np.empty((block, len(rhs)), dtype=dtype)
+    best_obj = None
+    best_idx = None
+
+    for start in range(0, total, block):
+        flat  = np.arange(start, min(start + block, total))
+        combo = np.stack(np.unravel_index(flat, sizes), axis=1).astype(dtype)
+        combo *= step  # (n, V)
 
         # ---- Feasibility check -------------------------------------------
-        feasible = True
-        for con in lp["constraints"]:
-            lhs = sum(con["coeff"][v] * trial[v] for v in vars_)
-            if lhs > con["rhs"]:
-                feasible = False
-                break
-        if not feasible:
+        lhs  = np.matmul(combo, A.T, out=lhs_buf[: len(flat)])
+        feas = (lhs <= rhs).all(axis=1)
+        if not feas.any():
             continue
 
         # ---- Objective ----------------------------------------------------
-        obj = sum(lp["objective"]["coeff"][v] * trial[v] for v in vars_)
-        if obj > best["objective"]:
-            best = trial | {"objective": obj}
+        # argmax returns the first maximum, and later blocks must beat the
+        # incumbent strictly, so ties resolve to the same combo the
+        # lexicographic itertools.product scan would have kept.
+        obj = combo @ c_vec
+        i   = np.where(feas, obj, -np.inf).argmax()
+        if best_obj is None or obj[i] > best_obj:
+            best_obj, best_idx = obj[i], start + i
+
+    return best_idx
+
+
+# ---------------------------------------------------------------------
+# Unrolled kernels for the common 2- and 3-variable teaching LPs.  With the
+# arity fixed, lhs / objective are plain broadcast sums of the axis vectors,
+# so no grid of combos is ever built or decoded.  Same contract as
+# _search_numpy; only used when the whole grid fits in one chunk.
+def _pick(feas, obj):
+    """Flat C-order index of the first best feasible point, or None."""
+    if not feas.any():
+        return None
+    return int(np.where(feas, obj, -np.inf).argmax())
+
+
+def _solve_2(A, rhs, c_vec, sizes, step):
+    dtype = _grid_dtype(A, c_vec, sizes, step)
+    A, c_vec = A.astype(dtype), c_vec.astype(dtype)
+    x0 = np.arange(sizes[0], dtype=dtype) * step
+    x1 = np.arange(sizes[1], dtype=dtype) * step
+
+    lhs  = (A[:, 0, None, None] * x0[None, :, None]
+            + A[:, 1, None, None] * x1[None, None, :])
+    feas = (lhs <= rhs[:, None, None]).all(axis=0)
+    obj  = c_vec[0] * x0[:, None] + c_vec[1] * x1[None, :]
+    return _pick(feas, obj)
+
+
+def _solve_3(A, rhs, c_vec, sizes, step):
+    dtype = _grid_dtype(A, c_vec, sizes, step)
+    A, c_vec = A.astype(dtype), c_vec.astype(dtype)
+    x0 = np.arange(sizes[0], dtype=dtype) * step
+    x1 = np.arange(sizes[1], dtype=dtype) * step
+    x2 = np.arange(sizes[2], dtype=dtype) * step
+
+    lhs  = (A[:, 0, None, None, None] * x0[None, :, None, None]
+            + A[:, 1, None, None, None] * x1[None, None, :, None]
+            + A[:, 2, None, None, None] * x2[None, None, None, :])
+    feas = (lhs <= rhs[:, None, None, None]).all(axis=0)
+    obj  = (c_vec[0] * x0[:, None, None] + c_vec[1] * x1[None, :, None]
+            + c_vec[2] * x2[None, None, :])
+    return _pick(feas, obj)
+
+
+_kernels = {2: _solve_2, 3: _solve_3}
+
+
+def _search_empty(A, rhs, c_vec, sizes, step):
+    """No variables: the grid is the single empty combo, feasible when
+    every row's rhs is >= 0."""
+    return 0 if (rhs >= 0).all() else None
+
+
+def _search_numba(A, rhs, c_vec, sizes, step):
+    """`_search_numpy`'s contract on the parallel Numba kernel.  numba is
+    imported here, on the first large grid, not when the package loads."""
+    from ._numba_kernel import bf_numba, get_num_threads
+
+    idx = bf_numba(
+        np.ascontiguousarray(A, dtype=np.float64),
+        np.asarray(rhs, dtype=np.float64),
+        np.asarray(c_vec, dtype=np.float64),
+        np.array(sizes, dtype=np.int64),
+        step,
+        4 * get_num_threads(),
+    )
+    return None if idx < 0 else int(idx)
+
+
+# ---------------------------------------------------------------------
+def brute_force_lp(lp: dict, step: int = 1):
+    """
+    Exhaustively enumerate every integer combination up to each var's 'ub',
+    stepping by `step` (default 1), and maximise the objective subject to
+    the constraints ('<=' by default, '>=' / '=' via each row's 'sense').
+    Returns:
+      best_dict  – dict of variable values + 'objective'
+      report     – Report: rows of constraint | lhs | rhs (.to_dataframe())
+    Raises ValueError if no combination is feasible.
+
+    Grids of 2**24+ points go to a parallel Numba kernel when numba is
+    installed; small 2- and 3-variable grids use unrolled kernels.
+    """
+    A, rhs, c_vec, bounds, vars_ = _compile_lp(lp)
+
+    # Cartesian grid of all integer counts, walked in C order as flat indices
+    sizes = tuple(len(range(0, ub + 1, step)) for ub in bounds)
+    total = math.prod(sizes)
+    if not sizes:
+        search = _search_empty
+    elif _HAS_NUMBA and total >= _NUMBA_MIN and \
+            _grid_dtype(A, c_vec, sizes, step) != object:
+        search = _search_numba  # float64 kernel: no grids past int64
+    elif total <= _BLOCK and len(vars_) in _kernels:
+        search = _kernels[len(vars_)]
+    else:
+        search = _search_numpy
+    best_idx = search(A, rhs, c_vec, sizes, step)
+    if best_idx is None:
+        raise ValueError("No feasible solution found.")
+
+    best_vec = np.array(np.unravel_index(best_idx, sizes), dtype=np.int64) * step
+    best     = dict(zip(vars_, best_vec.tolist()))
+    best["objective"] = c_vec.astype(object) @ best_vec.astype(object)
 
     # ---- Build LHS/RHS report --------------------------------------------
     rows = []
-    for con in lp["constraints"]:
-        lhs = sum(con["coeff"][v] * best[v] for v in vars_)
-        rows.append({"constraint": con["name"], "lhs": lhs, "rhs": con["rhs"]})
-    report = pd.DataFrame(rows)
-
-    return best, report
+    for con, con_lhs in zip(lp["constraints"], _con_lhs(lp, A, best_vec)):
+        rows.append({"constraint": con["name"], "lhs": con_lhs, "rhs": con["rhs"]})
+    return best, Report(rows)
 
 
 # ---------------------------------------------------------------------
 def sample_lp(lp: dict, num_samples: int = 20_000, seed: int | None = None):
     """
     Monte-Carlo sampler for quicker 'good-enough' solutions.
-    Returns top 10 feasible samples sorted by objective.
+    Returns a DataFrame of the top 10 feasible samples sorted by objective.
     """
-    rng    = np.random.default_rng(seed)
-    vars_  = list(lp["vars"].keys())
-    bounds = [lp["vars"][v]["ub"] for v in vars_]
-    rows   = []
+    import pandas as pd
 
-    for _ in range(num_samples):
-        trial = {v: rng.integers(0, ub + 1) for v, ub in zip(vars_, bounds)}
+    A, rhs, cobj, bounds, vars_ = _compile_lp(lp)
+    rng = np.random.default_rng(seed)
 
-        # Feasibility
-        if any(
-            sum(con["coeff"][v] * trial[v] for v in vars_) > con["rhs"]
-            for con in lp["constraints"]
-        ):
-            continue
+    # One draw for every sample, then feasibility + objective as matmuls
+    X    = rng.integers(0, bounds + 1, size=(num_samples, len(vars_)),
+                        dtype=np.int64)
+    mask = (X @ A.T <= rhs).all(axis=1)
+    obj  = X @ cobj
 
-        obj = sum(lp["objective"]["coeff"][v] * trial[v] for v in vars_)
-        rows.append(trial | {"objective": obj})
+    # Top 10 by objective: partition, then sort just those rows
+    feas_X, feas_obj = X[mask], obj[mask]
+    k     = min(10, len(feas_obj))
+    top   = np.argpartition(-feas_obj, k - 1)[:k] if k else np.arange(0)
+    order = top[np.argsort(-feas_obj[top], kind="stable")]
 
-    return (
-        pd.DataFrame(rows)
-        .sort_values("objective", ascending=False)
-        .head(10)
-        .reset_index(drop=True)
-    )
\ No newline at end of file
+    best = pd.DataFrame(feas_X[order], columns=vars_)
+    best["objective"] = feas_obj[order]
+    return best
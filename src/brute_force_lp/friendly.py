@@ -3,24 +3,233 @@ Friendly brute-force LP solver with live progress prints.
 
 * Works for any number of integer decision variables.
 * Supports <=, >=, = constraints and max/min objectives.
-* Prints every `print_every` feasible combo so students can see the search.
+* With printing on, runs a branch-and-bound search and prints every
+  `print_every`-th feasible combo it visits, so students can see the search
+  (pruned subtrees are skipped, so far fewer combos are visited).
+* When silent, hands the whole grid to the compiled `_friendly` extension
+  if it has been built (see setup.py); otherwise falls back to the
+  branch-and-bound search.
 """
 
 from __future__ import annotations
-import pandas as pd
+import io, math, sys, time, numpy as np
+
+from .core import Report, _compile_lp, _con_lhs
+
+try:
+    from ._friendly import brute_force_c
+except ImportError:  # extension not built – pure-Python search only
+    brute_force_c = None
+
+_TOL = 1e-9  # slack for float round-off in the pruning bounds
+# The LP relaxation needs scipy, whose first import alone costs ~0.5 s, while
+# a typical teaching LP is searched in milliseconds; only grids of
+# _RELAX_MIN+ points (after bound tightening) solve the relaxation.
+_RELAX_MIN = 1 << 20
 
 # ---------------------------------------------------------------------
-def _feasible(trial: dict, constraints: list[dict], vars_: list[str]) -> bool:
-    """Return True if 'trial' satisfies every constraint."""
-    for con in constraints:
-        lhs = sum(con["coeff"].get(v, 0) * trial[v] for v in vars_)
-        rhs   = con["rhs"]
-        sense = con.get("sense", "<=")
-        if (sense == "<=" and lhs > rhs) or \
-           (sense == ">=" and lhs < rhs) or \
-           (sense == "="  and lhs != rhs):
-            return False
-    return True
+def _tighten_bounds(P: np.ndarray, q: np.ndarray, bounds: list[int],
+                    step: int):
+    """Single-row bound strengthening: the largest grid value each variable
+    can take in any row once every other variable sits at its most
+    favourable end of [0, ub]."""
+    ubs   = np.array(bounds, dtype=np.float64)
+    neg   = np.minimum(P, 0) * ubs          # most negative term of each var
+    slack = q[:, None] - (neg.sum(axis=1)[:, None] - neg)
+    caps  = np.floor(np.divide(slack, P, out=np.full_like(P, np.inf),
+                               where=P > 0) + _TOL)
+    tight = np.minimum(ubs, caps.min(axis=0, initial=np.inf))
+    if step > 1:
+        tight = tight // step * step
+    return tight.astype(np.int64)
+
+
+def _relaxation_bound(g: np.ndarray, P: np.ndarray, q: np.ndarray,
+                      ubs: np.ndarray) -> float:
+    """Optimum of the continuous relaxation of max g·x (inf if unknown,
+    -inf if the relaxation itself is infeasible)."""
+    if len(g) == 0 or (ubs < 0).any():
+        return float("inf")
+    try:
+        from scipy.optimize import linprog
+    except ImportError:  # scipy is optional – no LP-relaxation early stop
+        return float("inf")
+    res = linprog(-g, A_ub=P if len(q) else None, b_ub=q if len(q) else None,
+                  bounds=[(0, ub) for ub in ubs], method="highs")
+    if res.status == 2:
+        return -float("inf")
+    return -res.fun if res.status == 0 else float("inf")
+
+
+# ---------------------------------------------------------------------
+def _make_printer(vars_: list[str], flush_lines: int = 100,
+                  flush_secs: float = 0.25):
+    """Return (show, flush) for progress lines.
+
+    show(counter, combo) formats one line (combo in vars_ order) into a
+    StringIO buffer that goes to sys.stdout in a single write every
+    `flush_lines` lines (or `flush_secs`, so the search still looks live).
+    """
+    buf   = io.StringIO()
+    state = {"lines": 0, "last": time.monotonic()}
+
+    def flush():
+        sys.stdout.write(buf.getvalue())
+        buf.seek(0)
+        buf.truncate()
+        state["lines"], state["last"] = 0, time.monotonic()
+
+    def show(counter: int, combo: list[int]):
+        shown = ", ".join(f"{v!r}: {x}" for v, x in zip(vars_, combo))
+        buf.write(f"[feasible #{counter:>6}] {{{shown}}}\n")
+        state["lines"] += 1
+        if state["lines"] >= flush_lines or \
+                time.monotonic() - state["last"] >= flush_secs:
+            flush()
+
+    return show, flush
+
+
+# ---------------------------------------------------------------------
+def _search_compiled(A, rhs, cobj, ubs, step: int, maximize: bool):
+    """Run the compiled search on `_compile_lp` arrays.
+
+    Returns (best_combo, counter); best_combo is None if nothing is feasible.
+    """
+    as_f64 = lambda x: np.ascontiguousarray(x, dtype=np.float64)
+    return brute_force_c(as_f64(A), as_f64(rhs), as_f64(cobj),
+                         ubs, step, maximize)
+
+
+# ---------------------------------------------------------------------
+def _search_bnb(P: np.ndarray, q: np.ndarray, g: np.ndarray, bounds,
+                step: int, vars_: list[str], print_every: int | None):
+    """Branch-and-bound search for max g·x s.t. P x <= q on the grid.
+
+    Returns (best_combo, counter) in vars_ order; counter is the number of
+    feasible combos visited (pruned subtrees are never counted).
+    """
+    best_combo = None
+    counter    = 0
+
+    # -------------------- bounds for pruning -------------------------
+    tight_ub = _tighten_bounds(P, q, bounds, step)
+    points   = math.prod(int(ub) // step + 1 for ub in tight_ub)
+    z_star   = (_relaxation_bound(g, P, q, tight_ub)
+                if points >= _RELAX_MIN else float("inf"))
+    z_stop   = (z_star - _TOL * max(1.0, abs(z_star)) if np.isfinite(z_star)
+                else z_star)
+    best_g   = -float("inf")
+
+    # -------------------- iterative nested loops --------------------
+    # trial is an odometer over the grid, vars nested in the walk's order.
+    # lhs_at[L] / g_at[L] hold the row sums and objective of trial[:L], so
+    # moving one digit costs one column update and a combo costs C
+    # comparisons instead of re-summing every var.
+    V      = len(vars_)
+    trial  = [0] * V
+    lhs_at = np.zeros((V + 1, len(q)))
+    g_at   = [0.0] * (V + 1)
+    show, flush = _make_printer(vars_) if print_every else (None, None)
+
+    def search(order: np.ndarray, stop: float, quiet: bool = False):
+        """Walk the grid with vars_[order[0]] outermost, keeping combos that
+        beat best_g; return as soon as best_g >= stop.  A quiet walk neither
+        prints nor counts the combos it visits."""
+        back = np.argsort(order)  # trial position of each var in vars_
+        P_o, g_o, ub_o = P[:, order], g[order], tight_ub[order]
+
+        # neg_tail[:, L] = most negative lhs the vars L.. can still add
+        neg_tail = np.zeros((len(q), V + 1))
+        neg_tail[:, :-1] = np.cumsum(
+            (np.minimum(P_o, 0) * ub_o)[:, ::-1], axis=1)[:, ::-1]
+        pos = P_o > 0
+
+        def _bound(level: int, part_lhs: np.ndarray, part_g: float) -> float:
+            """Optimistic objective for any completion of vars level.."""
+            slack = q - part_lhs - neg_tail[:, level]
+            if (slack < -_TOL).any():
+                return -float("inf")
+            Pf   = P_o[:, level:]
+            caps = np.floor(np.divide(slack[:, None], Pf,
+                                      out=np.full_like(Pf, np.inf),
+                                      where=pos[:, level:]) + _TOL)
+            cap  = np.maximum(np.minimum(
+                ub_o[level:], caps.min(axis=0, initial=np.inf)), 0)
+            if step > 1:
+                cap = cap // step * step
+            gf = g_o[level:]
+            return part_g + float(np.where(gf > 0, gf * cap, 0).sum())
+
+        def _leaf(lhs: np.ndarray, obj_g: float) -> bool:
+            """Score one full combo; True once best_g reaches `stop`."""
+            nonlocal best_combo, counter, best_g
+            if not (lhs <= q).all():
+                return False
+            if not quiet:
+                counter += 1
+                if print_every and counter % print_every == 0:
+                    show(counter, [trial[i] for i in back])
+            if obj_g > best_g:
+                best_g, best_combo = obj_g, tuple(trial[i] for i in back)
+            return best_g >= stop
+
+        if V == 0:
+            _leaf(lhs_at[0], 0.0)
+            return
+        level, entering = 0, True
+        while level >= 0:
+            if entering:
+                if _bound(level, lhs_at[level], g_at[level]) <= best_g:
+                    level, entering = level - 1, False
+                    continue
+                trial[level] = 0
+            else:
+                trial[level] += step
+            val = trial[level]
+            if val > ub_o[level]:
+                level, entering = level - 1, False
+                continue
+
+            col   = P_o[:, level]
+            child = lhs_at[level] + col * val
+            if (child + neg_tail[:, level + 1] > q + _TOL)[col >= 0].any():
+                # this and every larger val overshoots a row whose lhs
+                # cannot fall as val grows
+                level, entering = level - 1, False
+                continue
+
+            obj_g = g_at[level] + g_o[level] * val
+            if level == V - 1:
+                if _leaf(child, obj_g):
+                    return  # incumbent reached `stop`
+                entering = False
+            else:
+                lhs_at[level + 1], g_at[level + 1] = child, obj_g
+                level, entering = level + 1, True
+
+    # Most-constrained variable outermost (smallest tightened range first)
+    # so pruning bites near the root.  That walk finds the optimum fast but
+    # not necessarily the first optimal combo in vars_ order, which is what
+    # the compiled kernel returns; with integral data every objective is an
+    # integer, so a second walk in vars_ order seeded half a unit below the
+    # optimum stops exactly at that combo.  That walk is quiet, so the
+    # printed search and the count cover each combo once.  Non-integral
+    # data walks vars_ order once, so every sum rounds as in the compiled
+    # kernel.
+    first = np.arange(V)
+    if (P % 1 == 0).all() and (g % 1 == 0).all():
+        order = np.argsort(tight_ub, kind="stable")
+    else:
+        order = first
+    if z_star > -float("inf"):
+        search(order, z_stop)
+        if best_combo is not None and (order != first).any():
+            z_best, best_g = best_g, best_g - 0.5
+            search(first, z_best, quiet=True)
+        if flush:
+            flush()
+    return best_combo, counter
 
 
 # ---------------------------------------------------------------------
@@ -32,58 +241,55 @@ def brute_force_lp_friendly(
     """
     Exhaustive search over integer grid.
 
+    Each variable's range is first tightened against the constraints.  The
+    printing search is then run as branch-and-bound: a subtree is skipped
+    when an optimistic completion of its objective cannot beat the best
+    combo so far, and on large grids a walk stops once the best combo
+    reaches the LP relaxation optimum (needs scipy).  The silent compiled
+    search is exhaustive.  Both return the first optimal combo in grid order.
+
     Parameters
     ----------
     lp : dict
         Parsed LP JSON from `parse_word_problem`.
     step : int, default 1
-        Grid spacing for each variable.
+        Grid spacing for each variable (must be >= 1).
     print_every : int or None
-        Print every Nth feasible combo (None = silent).
+        Print every Nth feasible combo visited (None = silent).
 
     Returns
     -------
     best : dict   – best variable mix + 'objective'
-    report : pd.DataFrame – LHS / RHS / slack for each constraint
+    report : Report – LHS / RHS / slack per constraint (.to_dataframe())
     """
-    vars_   = list(lp["vars"].keys())
-    bounds  = [lp["vars"][v]["ub"] for v in vars_]
+    if step < 1:
+        raise ValueError("step must be a positive integer.")
+    A, rhs, cobj, bounds, vars_ = _compile_lp(lp)  # rows are all A x <= rhs
 
     obj_sense = lp["objective"].get("sense", "max").lower()
-    best_obj  = -float("inf") if obj_sense == "max" else float("inf")
-    best_soln = None
-    counter   = 0  # counts feasible combos
-
-    # -------------------- recursive nested loops --------------------
-    def recurse(level: int, trial: dict):
-        nonlocal best_obj, best_soln, counter
-        if level == len(vars_):  # all vars assigned
-            if not _feasible(trial, lp["constraints"], vars_):
-                return
-            counter += 1
-            if print_every and counter % print_every == 0:
-                print(f"[feasible #{counter:>6}] {trial}")
-            obj = sum(lp["objective"]["coeff"][v] * trial[v] for v in vars_)
-            better = obj > best_obj if obj_sense == "max" else obj < best_obj
-            if better:
-                best_obj, best_soln = obj, trial.copy()
-            return
-
-        var = vars_[level]
-        for val in range(0, bounds[level] + 1, step):
-            recurse(level + 1, trial | {var: val})
-
-    recurse(0, {})
+    if brute_force_c is not None and not print_every:
+        best_combo, counter = _search_compiled(
+            A, rhs, cobj, bounds, step, maximize=obj_sense == "max"
+        )
+        summary = f"Searched {counter} feasible combos."
+    else:
+        g = cobj.astype(np.float64) * (1 if obj_sense == "max" else -1)
+        best_combo, counter = _search_bnb(A.astype(np.float64),
+                                          rhs.astype(np.float64), g,
+                                          bounds, step, vars_, print_every)
+        summary = (f"Visited {counter} feasible combos "
+                   "(branch-and-bound skipped the rest).")
 
-    if best_soln is None:
+    if best_combo is None:
         raise ValueError("No feasible solution found.")
 
-    best_soln["objective"] = best_obj
+    best_vec  = np.array(best_combo, dtype=np.int64)
+    best_soln = dict(zip(vars_, best_combo))
+    best_soln["objective"] = (cobj @ best_vec).item()
 
     # -------------------- build constraint report ------------------
     rows = []
-    for con in lp["constraints"]:
-        lhs = sum(con["coeff"].get(v, 0) * best_soln[v] for v in vars_)
+    for con, lhs in zip(lp["constraints"], _con_lhs(lp, A, best_vec)):
         sense = con.get("sense", "<=")
         slack = (
             con["rhs"] - lhs if sense == "<=" else
@@ -93,7 +299,7 @@ def brute_force_lp_friendly(
             dict(constraint=con["name"], lhs=lhs, rhs=con["rhs"],
                  sense=sense, slack=slack)
         )
-    report = pd.DataFrame(rows)
+    report = Report(rows)
 
-    print(f"\n🔍 Searched {counter} feasible combos.")
+    print(f"\n🔍 {summary}")
     return best_soln, report
@@ -4,9 +4,16 @@ Scope (v0): max-profit LPs with ‘≤’ constraints and integer, non-negative
 """
 
 from __future__ import annotations
-import os, json
+import os, io, copy, json, hashlib, functools, tempfile
+from typing import Iterable
+from pathlib import Path
 from openai import OpenAI
 
+# Responses are cached on disk so repeated prompts skip the API call.
+_CACHE_DIR = Path(
+    os.getenv("LP_PARSER_CACHE_DIR", Path.home() / ".cache" / "lp_parser")
+)
+
 _JSON_SCHEMA = """
 {
   "objective": {"sense": "max", "coeff": {"<var>": <float>, ...}},
@@ -18,10 +25,66 @@ _JSON_SCHEMA = """
 }
 """
 
+def _cache_path(problem_text: str, model: str) -> Path:
+    key = hashlib.sha256(
+        json.dumps([model, _JSON_SCHEMA, problem_text]).encode()
+    ).hexdigest()
+    return _CACHE_DIR / f"{key}.json"
+
+def _cache_write(path: Path, raw: str) -> None:
+    """Write atomically; a read-only cache dir just means no caching."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(raw)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)  # don't leave a half-written file behind
+        except OSError:
+            pass
+
+def _read_json_stream(pieces: Iterable[str]) -> str:
+    """
+    Accumulate streamed text and return as soon as the top-level JSON object
+    closes and parses; otherwise return everything that arrived.
+    """
+    buf, depth, in_str, escape = io.StringIO(), 0, False, False
+    seen = 0  # characters scanned before the current piece
+    for piece in pieces:
+        buf.write(piece)
+        for end, ch in enumerate(piece, seen + 1):
+            if in_str:
+                if escape:
+                    escape = False
+                elif ch == "\\":
+                    escape = True
+                elif ch == '"':
+                    in_str = False
+            elif ch == '"':
+                in_str = True
+            elif ch == "{":
+                depth += 1
+            elif ch == "}" and depth > 0:
+                depth -= 1
+                if depth == 0:
+                    text = buf.getvalue()[:end]
+                    try:
+                        json.loads(text)
+                    except json.JSONDecodeError:
+                        continue
+                    return text
+        seen += len(piece)
+    return buf.getvalue()
+
 def _llm_extract(problem_text: str, model: str = "gpt-4o") -> str:
-    """Call OpenAI with JSON mode and return raw JSON string."""
+    """Call OpenAI with JSON mode (streamed) and return raw JSON string."""
     client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-    response = client.chat.completions.create(
+    stream = client.chat.completions.create(
         model=model,
         messages=[
             {
@@ -35,17 +98,48 @@ def _llm_extract(problem_text: str, model: str = "gpt-4o") -> str:
         ],
         temperature=0.0,
         response_format={"type": "json_object"},
+        stream=True,
     )
-    return response.choices[0].message.content
+    try:
+        raw = _read_json_stream(
+            chunk.choices[0].delta.content or ""
+            for chunk in stream if chunk.choices
+        )
+    finally:
+        stream.response.close()  # stop reading once the object is complete
+    return raw
 
-def parse_word_problem(problem_text: str, model: str = "gpt-4o") -> dict:
-    """Return a Python dict describing the LP or raise ValueError on failure."""
+def _is_lp(lp) -> bool:
+    # ⬇️ very light validation (students can improve)
+    return isinstance(lp, dict) and all(
+        key in lp for key in ("objective", "vars", "constraints")
+    )
+
+@functools.lru_cache(maxsize=256)
+def _cached_extract(problem_text: str, model: str) -> dict:
+    """
+    `_llm_extract` behind the memory and disk caches.  A reply that is not
+    valid JSON, or lacks the required keys, raises ValueError, so lru_cache
+    (which never stores exceptions) and the disk cache only ever keep good
+    responses; a cache file failing the same checks is refetched.
+    """
+    path = _cache_path(problem_text, model)
+    try:
+        lp = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        lp = None
+    if _is_lp(lp):
+        return lp
     raw = _llm_extract(problem_text, model=model)
     try:
         lp = json.loads(raw)
     except json.JSONDecodeError as e:
         raise ValueError(f"LLM did not return valid JSON: {e}") from None
-    # ⬇️ very light validation (students can improve)
-    if "objective" not in lp or "vars" not in lp or "constraints" not in lp:
+    if not _is_lp(lp):
         raise ValueError("Parsed JSON missing required keys.")
-    return lp
\ No newline at end of file
+    _cache_write(path, raw)
+    return lp
+
+def parse_word_problem(problem_text: str, model: str = "gpt-4o") -> dict:
+    """Return a Python dict describing the LP or raise ValueError on failure."""
+    return copy.deepcopy(_cached_extract(problem_text, model))